@@ -8,20 +8,14 @@ from playwright.async_api import BrowserContext, Cookie, Page
 
 
 def convert_playwright_cookies(cookies: Iterable[Cookie]) -> list[tuple[str, str]]:
-    converted: list[tuple[str, str]] = []
-    for cookie in cookies:
-        name = cookie.get("name")
-        value = cookie.get("value")
-        if name and value:
-            converted.append((name, value))
-    return converted
+    return [
+        (name, value)
+        for cookie in cookies
+        if (name := cookie.get("name")) and (value := cookie.get("value"))
+    ]
 
 
 async def extract_cookies(pw: BrowserContext | Page) -> list[tuple[str, str]]:
-    match pw:
-        case BrowserContext():
-            context = pw
-        case Page():
-            context = pw.context
-
+    # Only `Page` exposes `.context`, a `BrowserContext` is used as is
+    context: BrowserContext = getattr(pw, "context", pw)
     return convert_playwright_cookies(await context.cookies())
@@ -2,22 +2,54 @@ import asyncio
 from collections.abc import Awaitable, Callable
 from datetime import timedelta
 from functools import wraps
+from types import TracebackType
 
 
-def timeout(duration: timedelta):
+class _Timeout:
     """
-    Adds a timeout to an async function
+    An `asyncio.timeout` scope which doubles as a decorator, see `timeout`.
     """
 
-    def decorator[**P, R](func: Callable[P, Awaitable[R]]):
+    def __init__(self, seconds: float):
+        self._seconds = seconds
+        self._scope: asyncio.Timeout | None = None
+
+    def __call__[**P, R](
+        self, func: Callable[P, Awaitable[R]]
+    ) -> Callable[P, Awaitable[R]]:
+        seconds = self._seconds
+
+        # Every call opens its own scope, so concurrent calls never share this instance
         @wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-            async with asyncio.timeout(duration.total_seconds()):
+            async with asyncio.timeout(seconds):
                 return await func(*args, **kwargs)
 
         return wrapper
 
-    return decorator
+    async def __aenter__(self) -> asyncio.Timeout:
+        # Mirrors `asyncio.Timeout`, an instance guards one `async with` at a time
+        if self._scope is not None:
+            raise RuntimeError("Timeout has already been entered")
+        self._scope = asyncio.timeout(self._seconds)
+        return await self._scope.__aenter__()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        scope, self._scope = self._scope, None
+        assert scope is not None
+        await scope.__aexit__(exc_type, exc_val, exc_tb)
+
+
+def timeout(duration: timedelta) -> _Timeout:
+    """
+    Adds a timeout to an async function, can also be used as an async context manager
+    """
+    return _Timeout(duration.total_seconds())
 
 
 def retry(
@@ -28,25 +60,42 @@ def retry(
     """
     Retries an async function a number of times with a delay between each attempt, with an optional timeout
     """
+    # The timeout bounds all attempts and delays
+    seconds = timeout_duration.total_seconds() if timeout_duration else None
 
     def decorator[**P, R](func: Callable[P, Awaitable[R]]):
-        @wraps(func)
-        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-            attempt = 1
-            while True:
-                try:
-                    return await func(*args, **kwargs)
-                except Exception as e:
-                    if attempt < attempts:
+        if seconds is None:
+
+            @wraps(func)
+            async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+                attempt = 1
+                while True:
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception:
+                        if attempt >= attempts:
+                            raise
                         if delay:
                             await asyncio.sleep(delay)
                         attempt += 1
-                    else:
-                        raise e
 
-        if timeout_duration:
-            wrapper = timeout(timeout_duration)(wrapper)
+            return wrapper
 
-        return wrapper
+        # Same loop as above, inlined so the timeout adds no extra coroutine frame
+        @wraps(func)
+        async def timed_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            async with asyncio.timeout(seconds):
+                attempt = 1
+                while True:
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception:
+                        if attempt >= attempts:
+                            raise
+                        if delay:
+                            await asyncio.sleep(delay)
+                        attempt += 1
+
+        return timed_wrapper
 
     return decorator
@@ -33,10 +33,48 @@ LIGHT_BLOCK_PRESET: list[ResourceType] = [
 async def block_resources(
     page: Page, *, resources: Sequence[ResourceType] = LIGHT_BLOCK_PRESET
 ):
+    blocked = frozenset(resources)
+
     async def route(route: Route, request: Request):
-        if request.resource_type in resources:
+        if request.resource_type in blocked:
             await route.abort()
         else:
             await route.continue_()
 
     await page.route("**/*", route)
+
+
+LIGHT_BLOCK_EXTENSIONS: list[str] = [
+    "css",
+    "png",
+    "jpg",
+    "jpeg",
+    "gif",
+    "webp",
+    "svg",
+    "ico",
+    "woff",
+    "woff2",
+    "ttf",
+    "mp4",
+    "webm",
+]
+
+
+async def block_extensions(
+    page: Page, *, extensions: Sequence[str] = LIGHT_BLOCK_EXTENSIONS
+):
+    """
+    Aborts requests whose url path ends with one of the given file extensions.
+    The url glob is matched by the playwright driver, so requests that are not blocked never reach python.
+    Urls with a query string or without an extension are let through, use `block_resources` to match on resource type instead.
+    Extensions may be given with or without a leading dot, no route is installed if none are given.
+    """
+    cleaned = [stripped for ext in extensions if (stripped := ext.lstrip("."))]
+    if not cleaned:
+        return
+
+    async def abort(route: Route):
+        await route.abort()
+
+    await page.route(f"**/*.{{{','.join(cleaned)}}}", abort)
@@ -33,6 +33,48 @@ async def test_timeout_decorator(
         await f()
 
 
+@pytest.mark.parametrize(
+    "timeout_duration, work_duration, expectation",
+    cases,
+)
+async def test_timeout_context_manager(
+    timeout_duration: timedelta,
+    work_duration: timedelta,
+    expectation: AbstractContextManager,
+):
+    with expectation:
+        async with timeout(timeout_duration):
+            await asyncio.sleep(work_duration.total_seconds())
+
+
+async def test_timeout_decorator_concurrent_calls():
+    @timeout(timedelta(milliseconds=50))
+    async def f(work_duration: float):
+        await asyncio.sleep(work_duration)
+        return work_duration
+
+    fast, slow = await asyncio.gather(f(0.01), f(0.1), return_exceptions=True)
+    assert fast == 0.01
+    assert isinstance(slow, asyncio.TimeoutError)
+
+
+async def test_timeout_context_manager_reuse():
+    t = timeout(timedelta(milliseconds=50))
+
+    async def work(work_duration: float):
+        async with t:
+            await asyncio.sleep(work_duration)
+
+    # Sequential reuse of the same instance is fine
+    await work(0.01)
+    await work(0.01)
+
+    # Concurrent reuse is rejected instead of clobbering the active scope
+    first, second = await asyncio.gather(work(0.1), work(0.01), return_exceptions=True)
+    assert isinstance(first, asyncio.TimeoutError)
+    assert isinstance(second, RuntimeError)
+
+
 async def test_retry_success_first_try():
     call_count = 0
 
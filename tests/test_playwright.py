@@ -0,0 +1,26 @@
+import pytest
+
+from scraper_tools.playwright import block_extensions
+
+
+class StubPage:
+    def __init__(self):
+        self.routes: list[str] = []
+
+    async def route(self, url, handler):
+        self.routes.append(url)
+
+
+@pytest.mark.parametrize(
+    "extensions, expected_routes",
+    [
+        pytest.param(["png", "css"], ["**/*.{png,css}"], id="plain"),
+        pytest.param([".png", "..woff2"], ["**/*.{png,woff2}"], id="leading-dots"),
+        pytest.param([], [], id="empty"),
+        pytest.param(["", "."], [], id="only-dots"),
+    ],
+)
+async def test_block_extensions(extensions: list[str], expected_routes: list[str]):
+    page = StubPage()
+    await block_extensions(page, extensions=extensions)  # type: ignore
+    assert page.routes == expected_routes